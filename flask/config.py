@@ -0,0 +1,13 @@
+import os
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def env_float(name, default):
+    return float(os.environ.get(name, default))
+
+
+# Maximum number of DELETE ... IF EXISTS queries in flight per cancel request
+CANCEL_CONCURRENCY = env_int("CANCEL_CONCURRENCY", 32)
@@ -0,0 +1,93 @@
+import asyncio
+import utils
+
+
+class PageWaiter:
+    """Bridges a cassandra-driver ResponseFuture into asyncio.
+
+    The driver invokes the callbacks from its own IO thread once per page, so
+    every page is handed over to the event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self, response_future):
+        self.response_future = response_future
+        self._loop = asyncio.get_running_loop()
+        self._waiter = self._loop.create_future()
+        response_future.add_callbacks(self._on_rows, self._on_error)
+
+    def _on_rows(self, rows):
+        self._loop.call_soon_threadsafe(self._resolve, rows, None)
+
+    def _on_error(self, exc):
+        self._loop.call_soon_threadsafe(self._resolve, None, exc)
+
+    def _resolve(self, rows, exc):
+        if self._waiter.done():
+            return
+        if exc is not None:
+            self._waiter.set_exception(exc)
+        else:
+            self._waiter.set_result(rows)
+
+    @property
+    def has_more_pages(self):
+        return self.response_future.has_more_pages
+
+    async def next_page(self):
+        rows = await self._waiter
+        self._waiter = self._loop.create_future()
+        return rows
+
+    async def fetch_next_page(self):
+        self.response_future.start_fetching_next_page()
+        return await self.next_page()
+
+
+def execute_async(query, parameters=None, **kwargs):
+    return utils.session.execute_async(query, parameters, **kwargs)
+
+
+async def execute(query, parameters=None, **kwargs):
+    """Run a single-page query (LWTs, point reads) and return its ResultSet.
+
+    The ResultSet is already complete when returned, so ``was_applied`` and
+    ``one()`` never block. Use ``fetch_all``/``iter_pages`` for paged reads.
+    """
+    response_future = execute_async(query, parameters, **kwargs)
+    await PageWaiter(response_future).next_page()
+    return response_future.result()
+
+
+async def iter_pages(query, parameters=None, **kwargs):
+    """Yield the rows of every page of a query without blocking the loop."""
+    waiter = PageWaiter(execute_async(query, parameters, **kwargs))
+    rows = await waiter.next_page()
+    yield rows
+    while waiter.has_more_pages:
+        rows = await waiter.fetch_next_page()
+        yield rows
+
+
+async def fetch_all(query, parameters=None, **kwargs):
+    result = []
+    async for rows in iter_pages(query, parameters, **kwargs):
+        result.extend(rows)
+    return result
+
+
+async def execute_concurrent(statements, concurrency):
+    """Run statements concurrently with at most ``concurrency`` in flight.
+
+    Mirrors cassandra.concurrent.execute_concurrent: returns a list of
+    ``(success, result_or_exception)`` tuples in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(statement):
+        async with semaphore:
+            try:
+                return True, await execute(statement)
+            except Exception as e:
+                return False, e
+
+    return await asyncio.gather(*(run(statement) for statement in statements))
@@ -1,6 +1,7 @@
 from quart import Blueprint, request, jsonify, render_template
-from utils import session
-import asyncio
+from utils import statements
+import config
+import db
 
 reservation_bp = Blueprint("reservation", __name__)
 
@@ -26,15 +27,8 @@ async def post_route():
     if seat_id < 0 and seat_id > 1000:
         return jsonify({"error": "seat_id must be between 0 and 1000"}), 400
 
-    def insert_reservation():
-        future = session.execute_async(
-            "INSERT INTO reservation (seat_id, user) VALUES (%s, %s) IF NOT EXISTS",
-            (seat_id, user),
-        )
-        return future.result()
-
     try:
-        result = await asyncio.to_thread(insert_reservation)
+        result = await db.execute(statements.bind("insert_reservation", seat_id, user))
         if result.was_applied:
             return jsonify({"message": "Reservation added successfully"}), 201
         else:
@@ -64,15 +58,8 @@ async def update_reservation():
     if seat_id < 0 or seat_id > 108:
         return jsonify({"error": "seat_id must be between 0 and 108"}), 400
 
-    def update_reservation_async():
-        future = session.execute_async(
-            "UPDATE reservation SET user = %s WHERE seat_id = %s IF EXISTS",
-            (user, seat_id),
-        )
-        return future.result()
-
     try:
-        result = await asyncio.to_thread(update_reservation_async)
+        result = await db.execute(statements.bind("update_reservation", user, seat_id))
         if result.was_applied:
             return jsonify({"message": "Reservation updated successfully"}), 201
         else:
@@ -87,12 +74,8 @@ async def get_all_reservations():
     for i in range(1, 109):
         seats.append(i)
 
-    def fetch_reservations():
-        future = session.execute_async("SELECT * FROM reservation")
-        return future.result()
-
     try:
-        result = await asyncio.to_thread(fetch_reservations)
+        result = await db.fetch_all(statements.bind("select_reservations"))
         reservations = []
         selected_seats = []
         for row in result:
@@ -136,21 +119,26 @@ async def cancel_reservation():
         if seat_id < 0 or seat_id > 108:
             return jsonify({"error": "seat_id must be between 0 and 108"}), 400
 
-    def cancel_reservation_async():
-        results = []
-        for seat_id in seat_id_tab:
-            query = "DELETE FROM reservation WHERE seat_id = %s IF EXISTS"
-            future = session.execute_async(query, (seat_id,))
-            results.append(future.result())
-        return results
-
-    try:
-        result = await asyncio.to_thread(cancel_reservation_async)
-        for res in result:
-            if not res.was_applied:
-                return jsonify({"error": "One or more reservations do not exist"}), 404
+    seat_ids = list(dict.fromkeys(seat_id_tab))
+    outcomes = await db.execute_concurrent(
+        [statements.bind("delete_reservation", seat_id) for seat_id in seat_ids],
+        config.CANCEL_CONCURRENCY,
+    )
+
+    results = {}
+    errors = {}
+    for seat_id, (success, res) in zip(seat_ids, outcomes):
+        if not success:
+            print("Error in cancel_reservation:", str(res))
+            results[seat_id] = "error"
+            errors[seat_id] = str(res)
+        elif res.was_applied:
+            results[seat_id] = "cancelled"
+        else:
+            results[seat_id] = "not_found"
 
-        return jsonify({"message": "Reservation cancelled successfully"}), 200
-    except Exception as e:
-        print("Error in cancel_reservation:", str(e))
-        return jsonify({"error": str(e)}), 500
+    if errors:
+        return jsonify({"error": "One or more cancellations failed", "results": results, "errors": errors}), 500
+    if "not_found" in results.values():
+        return jsonify({"error": "One or more reservations do not exist", "results": results}), 404
+    return jsonify({"message": "Reservation cancelled successfully", "results": results}), 200
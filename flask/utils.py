@@ -1,13 +1,58 @@
-from cassandra.cluster import Cluster
+from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
+from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
 import time
 
+QUERIES = {
+    "insert_reservation": "INSERT INTO reservation (seat_id, user) VALUES (?, ?) IF NOT EXISTS",
+    "update_reservation": "UPDATE reservation SET user = ? WHERE seat_id = ? IF EXISTS",
+    "delete_reservation": "DELETE FROM reservation WHERE seat_id = ? IF EXISTS",
+    "select_reservations": "SELECT * FROM reservation",
+}
+
+
+class StatementRegistry:
+    """Prepares every query once and hands out bound statements.
+
+    Bound statements carry the partition key as routing key, so the
+    token-aware policy sends them straight to a replica. The driver itself
+    re-prepares on node up and on UNPREPARED replies (e.g. after a schema
+    change); ``prepare_all`` can be called again to refresh everything.
+    """
+
+    def __init__(self, queries):
+        self.queries = queries
+        self.prepared = {}
+
+    def prepare_all(self, session):
+        for name, query in self.queries.items():
+            self.prepared[name] = session.prepare(query)
+
+    def bind(self, name, *values):
+        return self.prepared[name].bind(values)
+
+
+statements = StatementRegistry(QUERIES)
+
+
+def create_cluster():
+    profile = ExecutionProfile(
+        load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy())
+    )
+    return Cluster(
+        contact_points=["cassandra", "cassandra2"],
+        port=9042,
+        execution_profiles={EXEC_PROFILE_DEFAULT: profile},
+        prepare_on_all_hosts=True,
+        reprepare_on_up=True,
+    )
+
 
 def set_up():
     KEYSPACE = "cinema"
 
     for _ in range(10):
         try:
-            cluster = Cluster(contact_points=["cassandra", "cassandra2"], port=9042)
+            cluster = create_cluster()
             session = cluster.connect()
             break
         except Exception as e:
@@ -44,6 +89,8 @@ def set_up():
     """
     )
 
+    statements.prepare_all(session)
+
     return session
 
 
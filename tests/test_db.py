@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+import db
+import utils
+
+
+class DelayedFuture:
+    """Stands in for a driver ResponseFuture that completes after ``delay``."""
+
+    has_more_pages = False
+
+    def __init__(self, session, result, delay):
+        self.session = session
+        self._result = result
+        self.delay = delay
+
+    def add_callbacks(self, callback, errback):
+        def complete():
+            self.session.in_flight -= 1
+            if isinstance(self._result, Exception):
+                errback(self._result)
+            else:
+                callback([self._result])
+
+        asyncio.get_running_loop().call_later(self.delay, complete)
+
+    def result(self):
+        return self._result
+
+
+class RecordingSession:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def execute_async(self, query, parameters=None, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        result = RuntimeError(query) if query.startswith("fail") else query.upper()
+        return DelayedFuture(self, result, 0.005)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = RecordingSession()
+    monkeypatch.setattr(utils, "session", session)
+    return session
+
+
+async def test_execute_concurrent_keeps_order_and_bounds_concurrency(session):
+    outcomes = await db.execute_concurrent(["a", "fail b", "c", "d", "e"], 2)
+
+    assert [success for success, _ in outcomes] == [True, False, True, True, True]
+    assert [result for success, result in outcomes if success] == ["A", "C", "D", "E"]
+    assert isinstance(outcomes[1][1], RuntimeError)
+    assert session.max_in_flight == 2